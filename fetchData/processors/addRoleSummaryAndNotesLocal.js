@@ -26,6 +26,8 @@ const OUTPUT_PATH = path.resolve(__dirname, "../../public/data/pokemon.json");
 // Local AI Configuration
 const OLLAMA_MODEL = process.env.OLLAMA_MODEL || "llama3:latest"; // Default model
 const OLLAMA_HOST = process.env.OLLAMA_HOST || "http://localhost:11434";
+const OLLAMA_CONCURRENCY = parseInt(process.env.OLLAMA_CONCURRENCY, 10) || 2; // Pokemon analyzed in parallel
+const PROGRESS_INTERVAL = 10; // Log progress every N completed Pokemon
 
 /**
  * OLLAMA API INTERFACE
@@ -109,9 +111,22 @@ const checkOllamaAvailability = async () => {
   }
 };
 
+// Display names for the official league keys; anything else is capitalized on the fly
+const LEAGUE_DISPLAY = { great: "Great", ultra: "Ultra", master: "Master" };
+const leagueDisplayName = (league) => LEAGUE_DISPLAY[league] || league.charAt(0).toUpperCase() + league.slice(1);
+
+// Prompt notes for special forms, matched against mon.form in order (first match wins)
+const FORM_NOTES = [
+  ["Shadow", "- Shadow form: Higher attack, lower defense\n"],
+  ["Mega", "- Mega evolution: Temporary power boost\n"],
+  ["Gigantamax", "- Gigantamax form: Max Battle mechanics\n"],
+];
+
 /**
  * POKEMON DATA FORMATTER
- * Formats Pokemon data into a readable prompt for the local AI
+ * Formats Pokemon data into a readable prompt for the local AI.
+ * All four prompts embed the same block, so callers format it once per Pokemon
+ * and hand it to each prompt generator.
  */
 const formatPokemonData = (mon) => {
   const leagues = mon.leagues || {};
@@ -124,7 +139,7 @@ const formatPokemonData = (mon) => {
   let pvpPerformance = "PvP Performance:\n";
   Object.entries(leagues).forEach(([league, data]) => {
     if (data && data.score) {
-      pvpPerformance += `- ${league.charAt(0).toUpperCase() + league.slice(1)} League: ${data.score}/100\n`;
+      pvpPerformance += `- ${leagueDisplayName(league)} League: ${data.score}/100\n`;
     }
   });
 
@@ -143,15 +158,8 @@ const formatPokemonData = (mon) => {
   // Format special characteristics
   let specialInfo = "";
   if (mon.form && mon.form !== "normal") {
-    if (mon.form.includes("Shadow")) {
-      specialInfo += "- Shadow form: Higher attack, lower defense\n";
-    } else if (mon.form.includes("Mega")) {
-      specialInfo += "- Mega evolution: Temporary power boost\n";
-    } else if (mon.form.includes("Gigantamax")) {
-      specialInfo += "- Gigantamax form: Max Battle mechanics\n";
-    } else {
-      specialInfo += `- Special form: ${mon.form}\n`;
-    }
+    const formNote = FORM_NOTES.find(([marker]) => mon.form.includes(marker));
+    specialInfo += formNote ? formNote[1] : `- Special form: ${mon.form}\n`;
   }
 
   return `Pokemon: ${mon.name}
@@ -167,9 +175,7 @@ ${specialInfo}`;
 /**
  * LOCAL AI PROMPT GENERATORS
  */
-const generateQuickRolePrompt = (mon) => {
-  const pokemonData = formatPokemonData(mon);
-
+const generateQuickRolePrompt = (pokemonData) => {
   return `Pokemon GO Role Classification for Semi-Serious Players
 
 Data: ${pokemonData}
@@ -189,9 +195,7 @@ Respond with ONLY one of these exact phrases:
 Response:`;
 };
 
-const generateKeyTagsPrompt = (mon) => {
-  const pokemonData = formatPokemonData(mon);
-
+const generateKeyTagsPrompt = (pokemonData) => {
   return `Pokemon GO Tag Classification for Resource Management
 
 Data: ${pokemonData}
@@ -211,9 +215,7 @@ Example: "Meta Relevant, XL Investment, League Staple, Anti-Meta"
 Tags:`;
 };
 
-const generateRoleSummaryPrompt = (mon) => {
-  const pokemonData = formatPokemonData(mon);
-
+const generateRoleSummaryPrompt = (pokemonData) => {
   return `Pokemon GO Summary for Semi-Serious Players
 
 Data: ${pokemonData}
@@ -233,9 +235,7 @@ Examples:
 Summary:`;
 };
 
-const generateNotesPrompt = (mon) => {
-  const pokemonData = formatPokemonData(mon);
-
+const generateNotesPrompt = (pokemonData) => {
   return `Pokemon GO Strategic Analysis for Semi-Serious Players
 
 Data: ${pokemonData}
@@ -261,9 +261,9 @@ Analysis:`;
 /**
  * LOCAL AI-POWERED GENERATION FUNCTIONS
  */
-const generateLocalAIQuickRole = async (mon) => {
+const generateLocalAIQuickRole = async (mon, pokemonData) => {
   try {
-    const prompt = generateQuickRolePrompt(mon);
+    const prompt = generateQuickRolePrompt(pokemonData);
     const response = await callOllama(prompt);
     // Clean up the response to extract just the role
     let cleanRole = response
@@ -282,9 +282,9 @@ const generateLocalAIQuickRole = async (mon) => {
   }
 };
 
-const generateLocalAIKeyTags = async (mon) => {
+const generateLocalAIKeyTags = async (mon, pokemonData) => {
   try {
-    const prompt = generateKeyTagsPrompt(mon);
+    const prompt = generateKeyTagsPrompt(pokemonData);
     const response = await callOllama(prompt);
     // Clean up the response to extract just the tags
     let tagsText = response
@@ -308,9 +308,9 @@ const generateLocalAIKeyTags = async (mon) => {
   }
 };
 
-const generateLocalAIRoleSummary = async (mon) => {
+const generateLocalAIRoleSummary = async (mon, pokemonData) => {
   try {
-    const prompt = generateRoleSummaryPrompt(mon);
+    const prompt = generateRoleSummaryPrompt(pokemonData);
     const response = await callOllama(prompt);
     // Clean up the response to extract just the summary
     let cleanSummary = response
@@ -331,9 +331,9 @@ const generateLocalAIRoleSummary = async (mon) => {
   }
 };
 
-const generateLocalAIDetailedNotes = async (mon) => {
+const generateLocalAIDetailedNotes = async (mon, pokemonData) => {
   try {
-    const prompt = generateNotesPrompt(mon);
+    const prompt = generateNotesPrompt(pokemonData);
     const response = await callOllama(prompt);
     // Clean up the response to extract just the notes
     let cleanNotes = response
@@ -355,40 +355,69 @@ const generateLocalAIDetailedNotes = async (mon) => {
 };
 
 /**
- * BATCH PROCESSING FOR LOCAL AI
+ * NO-DATA FAST PATH
+ * Pokemon with no league scores, raid tier, defender tier or type rankings give the
+ * model nothing to work with, so they get a fixed collector-only result instead of
+ * four Ollama calls. Shadow/Mega/Gigantamax forms still go to the model, since their
+ * form note is real context for the role and tags.
  */
-const processLocalAIPokemonBatch = async (pokemon, batchSize = 2) => {
-  const results = [];
-
-  for (let i = 0; i < pokemon.length; i += batchSize) {
-    const batch = pokemon.slice(i, i + batchSize);
-    const batchNum = Math.floor(i / batchSize) + 1;
-    const totalBatches = Math.ceil(pokemon.length / batchSize);
-    const progress = ((i / pokemon.length) * 100).toFixed(1);
-
-    console.log(`🤖 Processing batch ${batchNum}/${totalBatches} (${progress}% complete) - Pokemon ${i + 1}-${Math.min(i + batchSize, pokemon.length)}`);
-
-    const batchPromises = batch.map(async (mon) => {
-      const [quickRole, keyTags, roleSummary, notes] = await Promise.all([generateLocalAIQuickRole(mon), generateLocalAIKeyTags(mon), generateLocalAIRoleSummary(mon), generateLocalAIDetailedNotes(mon)]);
-
-      return {
-        ...mon,
-        quickRole,
-        keyTags,
-        roleSummary,
-        notes,
-      };
-    });
+const hasNoCompetitiveData = (mon) => {
+  const hasLeagueScore = Object.values(mon.leagues || {}).some((data) => data && data.score);
+  const hasFormNote = FORM_NOTES.some(([marker]) => (mon.form || "").includes(marker));
+  return !hasLeagueScore && !mon.raidTier && !mon.defenderTier && !(mon.bestTypes && mon.bestTypes.length > 0) && !hasFormNote;
+};
 
-    const batchResults = await Promise.all(batchPromises);
-    results.push(...batchResults);
+const noCompetitiveDataResult = (mon) => ({
+  quickRole: "Collector Only",
+  keyTags: ["Trash Tier", "Candy Fodder", "Skip Building"],
+  roleSummary: `${mon.name} lacks competitive viability in current meta. Transfer for candy - your stardust is better spent elsewhere.`,
+  notes: `${mon.name} offers no competitive advantages in current meta formats. It has no PvP, raid or gym role worth building for. Transfer extras unless you're a completionist collector.`,
+});
 
-    // Small delay between batches to prevent overwhelming local model
-    if (i + batchSize < pokemon.length) {
-      console.log("Waiting 1 second before next batch...");
-      await new Promise((resolve) => setTimeout(resolve, 1000));
+/**
+ * BATCH PROCESSING FOR LOCAL AI
+ * Keeps up to `concurrency` Pokemon in flight so one slow response doesn't stall
+ * the rest of a batch. Results are written back by index to preserve input order.
+ */
+const processLocalAIPokemonBatch = async (pokemon, concurrency = OLLAMA_CONCURRENCY) => {
+  const results = new Array(pokemon.length);
+  let nextIndex = 0;
+  let completed = 0;
+
+  const analyzeMon = async (mon) => {
+    if (hasNoCompetitiveData(mon)) return Object.assign(mon, noCompetitiveDataResult(mon));
+
+    const pokemonData = formatPokemonData(mon);
+    const [quickRole, keyTags, roleSummary, notes] = await Promise.all([
+      generateLocalAIQuickRole(mon, pokemonData),
+      generateLocalAIKeyTags(mon, pokemonData),
+      generateLocalAIRoleSummary(mon, pokemonData),
+      generateLocalAIDetailedNotes(mon, pokemonData),
+    ]);
+
+    // Assign in place rather than spreading a copy of every Pokemon record
+    mon.quickRole = quickRole;
+    mon.keyTags = keyTags;
+    mon.roleSummary = roleSummary;
+    mon.notes = notes;
+    return mon;
+  };
+
+  const worker = async () => {
+    while (nextIndex < pokemon.length) {
+      const i = nextIndex++;
+      results[i] = await analyzeMon(pokemon[i]);
+      completed++;
+
+      if (completed % PROGRESS_INTERVAL === 0 || completed === pokemon.length) {
+        const progress = ((completed / pokemon.length) * 100).toFixed(1);
+        console.log(`🤖 Processed ${completed}/${pokemon.length} (${progress}% complete) - latest: ${pokemon[i].name}`);
+      }
     }
-  }
+  };
+
+  const workerCount = Math.max(1, Math.min(concurrency, pokemon.length));
+  await Promise.all(Array.from({ length: workerCount }, worker));
 
   return results;
 };
@@ -398,7 +427,7 @@ const processLocalAIPokemonBatch = async (pokemon, batchSize = 2) => {
  */
 const addLocalAIRoleSummaryAndNotes = async () => {
   console.log("🤖 Adding Local AI-Generated Role Summary and Notes to Pokemon data...");
-  console.log(`📡 Using model: ${OLLAMA_MODEL} at ${OLLAMA_HOST}`);
+  console.log(`📡 Using model: ${OLLAMA_MODEL} at ${OLLAMA_HOST} (concurrency ${OLLAMA_CONCURRENCY})`);
 
   // Check if Ollama is available
   console.log("🔍 Checking Ollama availability...");
@@ -424,9 +453,10 @@ const addLocalAIRoleSummaryAndNotes = async () => {
   // Process all Pokemon - can be limited for testing by adding .slice(0, 10)
   const pokemonToProcess = data;
   console.log(`🚀 Processing ${pokemonToProcess.length} Pokemon with Local AI`);
+  console.log(`⏭️  ${pokemonToProcess.filter(hasNoCompetitiveData).length} have no competitive data and skip the model`);
 
   try {
-    const updatedData = await processLocalAIPokemonBatch(pokemonToProcess, 2); // Small batch size for local processing
+    const updatedData = await processLocalAIPokemonBatch(pokemonToProcess);
 
     fs.writeFileSync(OUTPUT_PATH, JSON.stringify(updatedData, null, 2));
     console.log(`✅ Successfully added local AI-generated role summaries and notes to ${updatedData.length} Pokemon`);
@@ -455,15 +485,16 @@ if (process.argv.includes("--demo")) {
   const samplePokemon = data.slice(0, 3);
 
   samplePokemon.forEach((mon, index) => {
+    const pokemonData = formatPokemonData(mon);
     console.log(`\n=== LOCAL AI DEMO ${index + 1}: ${mon.name} ===`);
     console.log("\n📝 QUICK ROLE PROMPT:");
-    console.log(generateQuickRolePrompt(mon));
+    console.log(generateQuickRolePrompt(pokemonData));
     console.log("\n📝 KEY TAGS PROMPT:");
-    console.log(generateKeyTagsPrompt(mon));
+    console.log(generateKeyTagsPrompt(pokemonData));
     console.log("\n📝 ROLE SUMMARY PROMPT:");
-    console.log(generateRoleSummaryPrompt(mon));
+    console.log(generateRoleSummaryPrompt(pokemonData));
     console.log("\n📝 DETAILED NOTES PROMPT:");
-    console.log(generateNotesPrompt(mon));
+    console.log(generateNotesPrompt(pokemonData));
     console.log("\n" + "=".repeat(50));
   });
 
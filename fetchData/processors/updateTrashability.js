@@ -55,6 +55,23 @@ const tierRank = {
   Trash: 1, // 🟥 No real use — bad stats, moves, or fully outclassed (30-35%)
 };
 
+// League groupings shared by the PvP rules: the three core meta leagues and the
+// limited formats that need higher scores to count
+const CORE_LEAGUES = ["great", "ultra", "master"];
+const LIMITED_LEAGUES = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
+
+// Core and limited league scores feed most of the PvP rules below. calculateTrashability
+// summarizes each Pokemon's leagues once and passes the result to those rules
+const summarizeLeagues = (leagues) => {
+  const coreScores = CORE_LEAGUES.map((league) => leagues[league]?.score || 0);
+  const limitedScores = LIMITED_LEAGUES.map((league) => leagues[league]?.score || 0);
+  return {
+    coreScores,
+    maxCoreScore: Math.max(...coreScores),
+    maxLimitedScore: Math.max(...limitedScores),
+  };
+};
+
 // Reverse mapping for converting numeric ranks back to tier names
 const rankToTier = Object.entries(tierRank).reduce((acc, [tier, rank]) => {
   acc[rank] = tier;
@@ -123,9 +140,10 @@ const hasAntiMetaCoverage = (mon, metaAttackTypes) => {
   return coverageCount >= 2; // Has coverage against at least 2 top meta types
 };
 
-// Simple type effectiveness check for common matchups
-const isTypeEffective = (attackType, defendType) => {
-  const effectiveness = {
+// Simple type effectiveness table for common matchups, built once as sets
+// because it is consulted for every charge move against every top meta type
+const TYPE_EFFECTIVENESS = Object.fromEntries(
+  Object.entries({
     fighting: ["normal", "rock", "steel", "ice", "dark"],
     rock: ["flying", "bug", "fire", "ice"],
     ground: ["poison", "rock", "steel", "fire", "electric"],
@@ -139,9 +157,11 @@ const isTypeEffective = (attackType, defendType) => {
     dark: ["ghost", "psychic"],
     steel: ["rock", "ice", "fairy"],
     fairy: ["fighting", "dragon", "dark"],
-  };
+  }).map(([attackType, defendTypes]) => [attackType, new Set(defendTypes)])
+);
 
-  return effectiveness[attackType]?.includes(defendType) || false;
+const isTypeEffective = (attackType, defendType) => {
+  return TYPE_EFFECTIVENESS[attackType]?.has(defendType) || false;
 };
 
 /**
@@ -312,42 +332,38 @@ const multiTypeCoverageScore = (bestTypes = []) => {
   return Math.min(score, 15);
 };
 
+// True if the Pokemon ranks within maxRank for any type with at least minScore.
+// bestTypes ranks and scores are scraped strings ("12.", "14.35")
+const hasTypeRanking = (mon, maxRank, minScore) => (mon.bestTypes || []).some((t) => parseInt(t.rank) <= maxRank && parseFloat(t.score) >= minScore);
+
 const moveDiversityScore = (bestTypes = []) => {
   const moves = bestTypes.map((t) => t.chargeMove).filter(Boolean);
   const uniqueMoves = new Set(moves);
   return uniqueMoves.size >= 2 ? 5 : 0;
 };
 
+// Defender tiers only differ by their leading letter ("A+ Tier" scores as A)
+const DEFENSE_TIER_SCORES = { S: 6, A: 5, B: 3, C: 1 };
 const defenseScore = (tier) => {
   if (!tier) return 0;
-  const t = tier.toUpperCase();
-  if (t.startsWith("S")) return 6;
-  if (t.startsWith("A")) return 5;
-  if (t.startsWith("B")) return 3;
-  if (t.startsWith("C")) return 1;
-  return 0;
+  return DEFENSE_TIER_SCORES[tier[0].toUpperCase()] ?? 0;
 };
 
-const legacyScore = (mon) => {
+// pvp is the enhanced PvP score and raid the raid tier score, both already
+// computed by calculateTrashability
+const legacyScore = (mon, pvp, raid) => {
   if (!mon.name.includes("*")) return 0;
-  const pvp = pvpScore(mon); // Use enhanced PvP score
-  const raid = raidTierScore(mon.raidTier);
   return pvp >= 4 || raid >= 6 ? 5 : 0;
 };
 
-const uniquenessScore = (mon) => {
-  const pvp = pvpScore(mon); // Use enhanced PvP score
-  const raid = raidTierScore(mon.raidTier);
+const uniquenessScore = (pvp, raid) => {
   return pvp + raid >= 30 ? 5 : 0;
 };
 
-const roleDominanceTier = (mon) => {
-  const leagues = mon.leagues || {};
+// adjustedPvpScore includes penalty logic (see pvpScore)
+const roleDominanceTier = (mon, leagues, leagueSummary, adjustedPvpScore, raidTier) => {
   const bestTypes = mon.bestTypes || [];
 
-  const adjustedPvpScore = pvpScore(mon); // includes penalty logic
-  const raidTier = raidTierScore(mon.raidTier);
-
   if (adjustedPvpScore === 0 && raidTier < 10) {
     return null;
   }
@@ -366,8 +382,8 @@ const roleDominanceTier = (mon) => {
   // Apply smart logic to dual league beasts too - require meta relevance beyond just stats
   if (isDualLeaguePvPBeast && adjustedPvpScore >= 26) {
     const hasMetaTyping = hasMetaRelevantTyping(mon);
-    const hasRoleClarity = hasDefinedMetaRole(mon, leagues);
-    const hasActualMetaRelevance = hasActualCompetitiveUsage(mon, leagues);
+    const hasRoleClarity = hasDefinedMetaRole(mon, leagueSummary);
+    const hasActualMetaRelevance = hasActualCompetitiveUsage(mon, leagues, leagueSummary);
     const hasStatQuality = hasCompetitiveStats(mon);
 
     if (mon.name === current) {
@@ -385,15 +401,13 @@ const roleDominanceTier = (mon) => {
 
   // NEW BLOCK: Tiered league scoring to prevent overfitting
   // Core meta leagues require lower threshold (true meta dominance)
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreLeagueHas90Plus = coreLeagues.some((name) => {
+  const coreLeagueHas90Plus = CORE_LEAGUES.some((name) => {
     const league = leagues[name];
     return league?.score >= 90; // Lowered from 92 to catch more legitimate meta threats
   });
 
   // Limited format leagues require higher threshold (must be truly dominant)
-  const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedLeagueHas93Plus = limitedLeagues.some((name) => {
+  const limitedLeagueHas93Plus = LIMITED_LEAGUES.some((name) => {
     const league = leagues[name];
     return league?.score >= 93;
   });
@@ -401,8 +415,16 @@ const roleDominanceTier = (mon) => {
   const hasStrongLeaguePerformance = coreLeagueHas90Plus || limitedLeagueHas93Plus;
 
   // Meaningful Essential criteria - require true meta dominance, not just high stats
-  const hasMultipleLeaguePresence = Object.values(leagues).filter((l) => l && l.score >= 80).length >= 2; // Lowered from 85
-  const hasDominantPerformance = Object.values(leagues).some((l) => l && l.score >= 90); // Lowered from 95
+  // (one pass over the leagues, without building an intermediate array)
+  let strongLeagueCount = 0;
+  let hasDominantPerformance = false;
+  for (const name in leagues) {
+    const league = leagues[name];
+    if (!league) continue;
+    if (league.score >= 80) strongLeagueCount++; // Lowered from 85
+    if (league.score >= 90) hasDominantPerformance = true; // Lowered from 95
+  }
+  const hasMultipleLeaguePresence = strongLeagueCount >= 2;
   const isMetaRelevant = hasStrongLeaguePerformance && (hasMultipleLeaguePresence || hasDominantPerformance);
 
   // Now do PvP anchor logic with stricter requirements to prevent overfitting
@@ -416,33 +438,33 @@ const roleDominanceTier = (mon) => {
     console.log("hasDominantPerformance:", hasDominantPerformance);
     console.log("isMetaRelevant:", isMetaRelevant);
     console.log("hasMetaTyping:", hasMetaRelevantTyping(mon));
-    console.log("hasRoleClarity:", hasDefinedMetaRole(mon, leagues));
-    console.log("hasActualMetaRelevance:", hasActualCompetitiveUsage(mon, leagues));
+    console.log("hasRoleClarity:", hasDefinedMetaRole(mon, leagueSummary));
+    console.log("hasActualMetaRelevance:", hasActualCompetitiveUsage(mon, leagues, leagueSummary));
     console.log("hasStatQuality:", hasCompetitiveStats(mon));
     console.log("types:", mon.types);
   }
 
   // Smart Essential criteria - require meta relevance beyond just high scores
   const hasMetaTyping = hasMetaRelevantTyping(mon);
-  const hasRoleClarity = hasDefinedMetaRole(mon, leagues);
 
   // More flexible Essential criteria for legitimate meta threats
   const hasStandardViability = adjustedPvpScore >= 23 && isMetaRelevant;
   const hasSpecialViability = adjustedPvpScore >= 20 && hasDominantPerformance && hasMetaTyping;
 
-  // Additional quality gates to prevent statistical overfitting
-  const hasActualMetaRelevance = hasActualCompetitiveUsage(mon, leagues);
-  const hasStatQuality = hasCompetitiveStats(mon);
+  // Additional quality gates to prevent statistical overfitting. Most Pokemon fail the
+  // score gates, so the role/usage/stat checks only run once those pass
+  const isEssential =
+    (hasStandardViability || hasSpecialViability) && hasMetaTyping && hasDefinedMetaRole(mon, leagueSummary) && hasActualCompetitiveUsage(mon, leagues, leagueSummary) && hasCompetitiveStats(mon);
 
-  if ((hasStandardViability || hasSpecialViability) && hasMetaTyping && hasRoleClarity && hasActualMetaRelevance && hasStatQuality) {
+  if (isEssential) {
     pvpAnchor = tierRank.Essential; // Requires all criteria including actual usage
-  } else if (isValuablePvPAlternative(mon, adjustedPvpScore, leagues)) {
+  } else if (isValuablePvPAlternative(mon, adjustedPvpScore, leagueSummary)) {
     pvpAnchor = tierRank.Valuable; // TIGHTENED: Requires worthiness check
-  } else if (isReliableAlternative(mon, adjustedPvpScore, leagues)) {
+  } else if (isReliableAlternative(mon, adjustedPvpScore, leagueSummary)) {
     pvpAnchor = tierRank.Reliable; // TIGHTENED: Requires worthiness check
-  } else if (isUsefulAlternative(mon, adjustedPvpScore, leagues)) {
+  } else if (isUsefulAlternative(mon, adjustedPvpScore, leagueSummary)) {
     pvpAnchor = tierRank.Useful; // PATTERN ANALYSIS: Demoted from Reliable
-  } else if (isNicheAlternative(mon, adjustedPvpScore, leagues)) {
+  } else if (isNicheAlternative(mon, adjustedPvpScore, leagueSummary)) {
     pvpAnchor = tierRank.Niche; // PATTERN ANALYSIS: Demoted from Useful
   } else if (adjustedPvpScore >= 6) pvpAnchor = tierRank.Useful; // Lowered from 8
 
@@ -464,20 +486,69 @@ const roleDominanceTier = (mon) => {
   if (pvpAnchor === tierRank.Reliable || eliteTypeCount >= 1) return tierRank.Reliable;
   if (pvpAnchor === tierRank.Useful) return tierRank.Useful;
 
-  const isStrongDefender = (mon.defenderTier || "").toUpperCase().startsWith("S");
+  const isStrongDefender = (mon.defenderTier || "")[0]?.toUpperCase() === "S";
   if (isStrongDefender) return tierRank.Useful;
 
   return null;
 };
 
+const NICHE_LEAGUE_TAGS = ["little", "hisui", "aurora", "onyx", "pillar", "ascension"];
+
 const isOnlyCupRelevant = (mon) => {
   const leagueKeys = Object.keys(mon.leagues || {});
   if (leagueKeys.length === 0) return false;
 
-  const nicheLeagues = ["little", "hisui", "aurora", "onyx", "pillar", "ascension"];
-  return leagueKeys.every((name) => nicheLeagues.some((tag) => name.toLowerCase().includes(tag)));
+  return leagueKeys.every((name) => NICHE_LEAGUE_TAGS.some((tag) => name.toLowerCase().includes(tag)));
 };
 
+// Compiles a list of typings (single types or dual-type pairs) into set lookups.
+// A single type matches any Pokemon that has it; a pair matches a Pokemon with
+// exactly that pair of types, in either order. Missing or null types never match
+const typingKey = (types) => [...types].sort().join("/");
+const compileTypings = (typings) => ({
+  singles: new Set(typings.filter((t) => t.length === 1).map((t) => t[0])),
+  pairs: new Set(typings.filter((t) => t.length > 1).map(typingKey)),
+});
+const matchesTyping = (compiled, types) => Array.isArray(types) && (types.some((type) => compiled.singles.has(type)) || compiled.pairs.has(typingKey(types)));
+
+// Meta-relevant type combinations that define roles in competitive play
+const META_TYPINGS = compileTypings([
+  // Core meta types - naturally strong in competitive environments
+  ["Dragon"], // Powerful offensive typing, limited weaknesses
+  ["Steel"], // Excellent defensive typing, resists many types
+  ["Fairy"], // Strong offensive typing, counters Dragons/Fighting
+  ["Ghost"], // Unique immunities and offensive presence
+  ["Psychic"], // Strong special attacks, useful resistances
+  ["Electric"], // Fast, strong offensive typing with good coverage
+  ["Normal"], // Neutral coverage, often paired with bulk for safe swaps
+  ["Rock"], // Strong offensive typing, excellent for raid DPS specialists
+
+  // Strong dual types - provide unique role compression
+  ["Water", "Ground"], // Swampert line - excellent coverage and bulk
+  ["Flying", "Dragon"], // Dragonite line - powerful offensive core
+  ["Steel", "Psychic"], // Metagross line - tanky with strong offense
+  ["Ghost", "Flying"], // Drifblim line - unique defensive profile
+  ["Dark", "Flying"], // Mandibuzz line - anti-meta defensive wall
+  ["Fighting", "Steel"], // Lucario line - offensive powerhouse
+  ["Fire", "Flying"], // Charizard line - strong offensive presence
+  ["Electric", "Flying"], // Zapdos line - speed control and coverage
+  ["Water", "Flying"], // Gyarados line - versatile threat
+  ["Grass", "Poison"], // Venusaur line - defensive with utility
+  ["Water", "Fairy"], // Azumarill line - bulky offensive threat
+  ["Steel", "Fairy"], // Magearna line - defensive powerhouse
+  ["Rock", "Fairy"], // Carbink line - defensive powerhouse with Fairy utility
+  ["Poison", "Ground"], // Clodsire line - anti-meta tank with unique resistances
+  ["Poison", "Dark"], // Drapion line - fast safe switch with coverage
+  ["Dark", "Ice"], // Weavile line - high-speed offensive threat
+  ["Ice", "Ground"], // Mamoswine line - dual-type coverage specialist
+
+  // Defensive cores - excel at tanking specific meta threats
+  ["Steel", "Flying"], // Skarmory line - physical wall
+  ["Water", "Steel"], // Empoleon line - special tank
+  ["Fire", "Steel"], // Heatran line - unique resistances
+  ["Psychic", "Flying"], // Lugia line - ultimate tank with unique resistances
+]);
+
 /**
  * META-RELEVANT TYPING ANALYSIS
  *
@@ -498,52 +569,8 @@ const hasMetaRelevantTyping = (mon) => {
   const types = mon.types || [];
   if (types.length === 0) return false;
 
-  // Meta-relevant type combinations that define roles in competitive play
-  const metaTypings = [
-    // Core meta types - naturally strong in competitive environments
-    ["Dragon"], // Powerful offensive typing, limited weaknesses
-    ["Steel"], // Excellent defensive typing, resists many types
-    ["Fairy"], // Strong offensive typing, counters Dragons/Fighting
-    ["Ghost"], // Unique immunities and offensive presence
-    ["Psychic"], // Strong special attacks, useful resistances
-    ["Electric"], // Fast, strong offensive typing with good coverage
-    ["Normal"], // Neutral coverage, often paired with bulk for safe swaps
-    ["Rock"], // Strong offensive typing, excellent for raid DPS specialists
-
-    // Strong dual types - provide unique role compression
-    ["Water", "Ground"], // Swampert line - excellent coverage and bulk
-    ["Flying", "Dragon"], // Dragonite line - powerful offensive core
-    ["Steel", "Psychic"], // Metagross line - tanky with strong offense
-    ["Ghost", "Flying"], // Drifblim line - unique defensive profile
-    ["Dark", "Flying"], // Mandibuzz line - anti-meta defensive wall
-    ["Fighting", "Steel"], // Lucario line - offensive powerhouse
-    ["Fire", "Flying"], // Charizard line - strong offensive presence
-    ["Electric", "Flying"], // Zapdos line - speed control and coverage
-    ["Water", "Flying"], // Gyarados line - versatile threat
-    ["Grass", "Poison"], // Venusaur line - defensive with utility
-    ["Water", "Fairy"], // Azumarill line - bulky offensive threat
-    ["Steel", "Fairy"], // Magearna line - defensive powerhouse
-    ["Rock", "Fairy"], // Carbink line - defensive powerhouse with Fairy utility
-    ["Poison", "Ground"], // Clodsire line - anti-meta tank with unique resistances
-    ["Poison", "Dark"], // Drapion line - fast safe switch with coverage
-    ["Dark", "Ice"], // Weavile line - high-speed offensive threat
-    ["Ice", "Ground"], // Mamoswine line - dual-type coverage specialist
-
-    // Defensive cores - excel at tanking specific meta threats
-    ["Steel", "Flying"], // Skarmory line - physical wall
-    ["Water", "Steel"], // Empoleon line - special tank
-    ["Fire", "Steel"], // Heatran line - unique resistances
-    ["Psychic", "Flying"], // Lugia line - ultimate tank with unique resistances
-  ];
-
   // Check if Pokemon's typing matches any meta-relevant combination
-  return metaTypings.some((metaTypes) => {
-    if (metaTypes.length === 1) {
-      return types.includes(metaTypes[0]);
-    } else {
-      return metaTypes.every((type) => types.includes(type));
-    }
-  });
+  return matchesTyping(META_TYPINGS, types);
 };
 
 /**
@@ -563,10 +590,8 @@ const hasMetaRelevantTyping = (mon) => {
  * - Golisopod: 93.3 Ultra + 81.4 Master (consistent but lacks clear role) ❌
  * - Shadow Metagross: Strong raid presence + decent PvP ✅
  */
-const hasDefinedMetaRole = (mon, leagues) => {
-  const coreLeagues = ["great", "ultra", "master"];
-  const corePerformances = coreLeagues.map((league) => leagues[league]?.score || 0);
-  const maxCoreScore = Math.max(...corePerformances);
+const hasDefinedMetaRole = (mon, leagueSummary) => {
+  const { coreScores: corePerformances, maxCoreScore } = leagueSummary;
 
   // Must excel in at least one core league (90+) - baseline requirement
   const hasStrongCorePresence = maxCoreScore >= 90;
@@ -592,12 +617,10 @@ const hasDefinedMetaRole = (mon, leagues) => {
  * - Multiple league presence (shows versatility)
  * - Reasonable performance floors (not just ceiling)
  */
-const hasActualCompetitiveUsage = (mon, leagues) => {
+const hasActualCompetitiveUsage = (mon, leagues, leagueSummary) => {
   // SMART OVERFITTING DETECTION - Replace static list with pattern recognition
 
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreScores = coreLeagues.map((league) => leagues[league]?.score || 0);
-  const maxCoreScore = Math.max(...coreScores);
+  const { coreScores, maxCoreScore, maxLimitedScore } = leagueSummary;
   const coreLeagueCount80 = coreScores.filter((score) => score >= 80).length;
   const raidScore = mon.raidTier ? raidTierScore(mon.raidTier) : 0;
 
@@ -640,28 +663,28 @@ const hasActualCompetitiveUsage = (mon, leagues) => {
 
   // Pattern 4: Simulation vs Reality Gap Detection
   // Pokemon with high simulation scores but known usage issues
-  const hasSimulationRealityGap = detectSimulationRealityGap(mon, maxCoreScore, raidScore);
+  const hasSimulationRealityGap = detectSimulationRealityGap(mon, leagues, maxCoreScore, raidScore);
   if (hasSimulationRealityGap) {
     return false; // High simulation scores but poor actual competitive viability
   }
 
   // Pattern 5: Role Dominance Check
   // Pokemon that are outclassed by better alternatives in the same role
-  const isOutclassedInRole = detectRoleOutclassing(mon, maxCoreScore);
+  const isOutclassedInRole = detectRoleOutclassing(mon, coreScores, maxCoreScore);
   if (isOutclassedInRole) {
     return false; // Outclassed by better Pokemon in same role
   }
 
   // Pattern 6: Move Quality Check
   // Pokemon with poor movesets despite good typing/stats
-  const hasPoorMovesets = detectPoorMovesets(mon, maxCoreScore);
+  const hasPoorMovesets = detectPoorMovesets(mon, leagues, maxCoreScore, raidScore);
   if (hasPoorMovesets) {
     return false; // Poor moveset quality limits practical viability
   }
 
   // Pattern 7: Niche Typing with Moderate Performance
   // Pokemon with decent scores but typing combinations that tend to underperform in practice
-  const hasNicheTypingIssues = detectNicheTypingIssues(mon, maxCoreScore, raidScore);
+  const hasNicheTypingIssues = detectNicheTypingIssues(mon, leagues, maxCoreScore, raidScore);
   if (hasNicheTypingIssues) {
     return false; // Niche typing with moderate scores often indicates limited practical usage
   }
@@ -674,7 +697,7 @@ const hasActualCompetitiveUsage = (mon, leagues) => {
   }
 
   // Relaxed raid criteria for DPS leaders - A Tier can qualify if they're type leaders
-  const hasTopTypeRanking = (mon.bestTypes || []).some((t) => parseInt(t.rank) <= 3 && parseFloat(t.score) >= 14);
+  const hasTopTypeRanking = hasTypeRanking(mon, 3, 14);
   if (hasTopTypeRanking && raidScore >= 10) {
     return true; // Top 3 in type + A tier = clear specialist (lowered from A+ requirement)
   }
@@ -684,9 +707,6 @@ const hasActualCompetitiveUsage = (mon, leagues) => {
   const hasMultipleCorePresence = coreScores.filter((score) => score >= 87).length >= 2; // Raised from 85
 
   // Minor leagues (limited formats) need much higher scores to justify Essential
-  const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
-  const maxLimitedScore = Math.max(...limitedScores);
   const isClearBestInLimited = maxLimitedScore >= 95 && maxCoreScore < 80;
 
   return isClearBestInCore || hasMultipleCorePresence || isClearBestInLimited;
@@ -707,14 +727,25 @@ const hasCompetitiveStats = (mon) => {
   // For now, use league performance as a proxy for stat quality
   // Pokemon with truly poor stats won't achieve high league scores
   const leagues = mon.leagues || {};
-  const allScores = Object.values(leagues).map((l) => l?.score || 0);
-  const maxScore = Math.max(...allScores);
+  let maxScore = 0;
+  for (const name in leagues) {
+    const score = leagues[name]?.score || 0;
+    if (score > maxScore) maxScore = score;
+  }
 
   // If Pokemon can achieve 90+ in any league, stats are probably adequate
   // If max score is very low (<80), likely has stat quality issues
   return maxScore >= 80;
 };
 
+// Typings that tend to simulate well but play poorly
+const AWKWARD_TYPINGS = compileTypings([
+  ["Psychic"], // Often struggles with Dark/Ghost meta
+  ["Normal"], // Neutral damage often underwhelming in practice
+  ["Rock", "Grass"], // Defensive typing with too many weaknesses
+  ["Ground", "Ghost"], // Unusual combination, often lacks synergy
+]);
+
 /**
  * SIMULATION vs REALITY GAP DETECTION
  *
@@ -722,12 +753,12 @@ const hasCompetitiveStats = (mon) => {
  * This is the hardest pattern to catch because it requires identifying the gap between
  * theoretical performance and practical viability
  */
-const detectSimulationRealityGap = (mon, maxCoreScore, raidScore) => {
+const detectSimulationRealityGap = (mon, leagues, maxCoreScore, raidScore) => {
   // Pattern: High simulation scores in non-core leagues but poor actual usage indicators
 
   // Check for Pokemon that excel mainly in limited/niche leagues
   const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine", "onyx"];
-  const limitedScores = limitedLeagues.map((league) => mon.leagues?.[league]?.score || 0);
+  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
   const maxLimitedScore = Math.max(...limitedScores);
 
   // Red flag: Much better in limited leagues than core leagues
@@ -736,20 +767,7 @@ const detectSimulationRealityGap = (mon, maxCoreScore, raidScore) => {
   }
 
   // Pattern: Pokemon with awkward typing combinations that sim well but play poorly
-  const awkwardTypings = [
-    ["Psychic"], // Often struggles with Dark/Ghost meta
-    ["Normal"], // Neutral damage often underwhelming in practice
-    ["Rock", "Grass"], // Defensive typing with too many weaknesses
-    ["Ground", "Ghost"], // Unusual combination, often lacks synergy
-  ];
-
-  const hasAwkwardTyping = awkwardTypings.some((awkwardTypes) => {
-    if (awkwardTypes.length === 1) {
-      return mon.types?.includes(awkwardTypes[0]);
-    } else {
-      return awkwardTypes.every((type) => mon.types?.includes(type));
-    }
-  });
+  const hasAwkwardTyping = matchesTyping(AWKWARD_TYPINGS, mon.types);
 
   // Red flag: High scores with awkward typing (likely overfitted)
   if (hasAwkwardTyping && maxCoreScore >= 90 && maxCoreScore < 96 && raidScore < 15) {
@@ -765,7 +783,7 @@ const detectSimulationRealityGap = (mon, maxCoreScore, raidScore) => {
  * Detects Pokemon that are outclassed by better alternatives in the same role
  * Based on typing, role, and known competitive hierarchy
  */
-const detectRoleOutclassing = (mon, maxCoreScore) => {
+const detectRoleOutclassing = (mon, coreScores, maxCoreScore) => {
   // Pattern: Pokemon with good simulation scores but likely outclassed by better alternatives
 
   // Pattern 1: Mono-Ghost types with moderate scores (likely outclassed by dual-type Ghosts)
@@ -785,8 +803,6 @@ const detectRoleOutclassing = (mon, maxCoreScore) => {
 
   // Pattern 4: Fairy/Steel types with limited league performance (often niche)
   if (mon.types?.includes("Fairy") && mon.types?.includes("Steel") && maxCoreScore < 95) {
-    const coreLeagues = ["great", "ultra", "master"];
-    const coreScores = coreLeagues.map((league) => mon.leagues?.[league]?.score || 0);
     const coreLeagueCount90 = coreScores.filter((score) => score >= 90).length;
 
     if (coreLeagueCount90 === 0) {
@@ -803,14 +819,13 @@ const detectRoleOutclassing = (mon, maxCoreScore) => {
  * Detects Pokemon with poor movesets that limit their practical viability
  * despite good typing and stats
  */
-const detectPoorMovesets = (mon, maxCoreScore) => {
+const detectPoorMovesets = (mon, leagues, maxCoreScore, raidScore) => {
   // Pattern: High simulation scores but likely poor practical movesets
 
   // This is harder to detect without actual moveset data, so we use proxy indicators
 
   // Pattern 1: Pokemon with very high simulation scores but poor raid performance
   // Often indicates good stats/typing but poor moveset for practical use
-  const raidScore = mon.raidTier ? raidTierScore(mon.raidTier) : 0;
   if (maxCoreScore >= 93 && raidScore === 0 && !mon.types?.includes("Psychic")) {
     // High PvP simulation score but no raid utility often indicates moveset issues
     // (Excluding Psychic types which are naturally poor in raids)
@@ -819,16 +834,12 @@ const detectPoorMovesets = (mon, maxCoreScore) => {
 
   // Pattern 2: Pokemon with moderate simulation scores in limited leagues only
   // Often indicates movesets that work in specific formats but not general play
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreScores = coreLeagues.map((league) => mon.leagues?.[league]?.score || 0);
-  const maxCoreInCore = Math.max(...coreScores);
-
   const limitedLeagues = ["battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedScores = limitedLeagues.map((league) => mon.leagues?.[league]?.score || 0);
+  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
   const maxLimited = Math.max(...limitedScores);
 
   // High limited league score but poor core league performance suggests format-specific movesets
-  if (maxLimited >= 93 && maxCoreInCore < 85) {
+  if (maxLimited >= 93 && maxCoreScore < 85) {
     return true; // Likely has movesets that only work in specific restricted formats
   }
 
@@ -841,7 +852,7 @@ const detectPoorMovesets = (mon, maxCoreScore) => {
  * Detects Pokemon with typing combinations that tend to underperform in practice
  * despite having decent simulation scores
  */
-const detectNicheTypingIssues = (mon, maxCoreScore, raidScore) => {
+const detectNicheTypingIssues = (mon, leagues, maxCoreScore, raidScore) => {
   // Pattern: Typing combinations that look good on paper but struggle in practice
 
   // Bug/Steel types - often have limited meta presence despite decent defensive typing
@@ -862,7 +873,7 @@ const detectNicheTypingIssues = (mon, maxCoreScore, raidScore) => {
   // Fairy/Steel types with moderate limited league performance
   if (mon.types?.includes("Fairy") && mon.types?.includes("Steel") && maxCoreScore < 95) {
     const limitedLeagues = ["battlefrontiermaster", "battlefrontierultra", "sunshine"];
-    const limitedScores = limitedLeagues.map((league) => mon.leagues?.[league]?.score || 0);
+    const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
     const maxLimited = Math.max(...limitedScores);
 
     // High limited league score but moderate core performance suggests format-specific viability
@@ -947,10 +958,8 @@ const detectTournamentUsage = (mon, maxCoreScore) => {
  * Determines if a Pokemon is worthy of Valuable tier for PvP
  * Focus: Strong alternatives that are rewarding to develop
  */
-const isValuablePvPAlternative = (mon, pvpScore, leagues) => {
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreScores = coreLeagues.map((league) => leagues[league]?.score || 0);
-  const maxCoreScore = Math.max(...coreScores);
+const isValuablePvPAlternative = (mon, pvpScore, leagueSummary) => {
+  const { coreScores, maxCoreScore, maxLimitedScore } = leagueSummary;
   const coreLeagueCount85 = coreScores.filter((score) => score >= 85).length;
 
   // High performers that just missed Essential (87+ in core leagues) - TIGHTENED
@@ -964,10 +973,6 @@ const isValuablePvPAlternative = (mon, pvpScore, leagues) => {
   }
 
   // Exceptional limited league specialists with some core league backup - TIGHTENED
-  const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
-  const maxLimitedScore = Math.max(...limitedScores);
-
   if (maxLimitedScore >= 97 && maxCoreScore >= 80 && pvpScore >= 18) {
     return true; // Exceptional limited league specialists (raised thresholds)
   }
@@ -1000,7 +1005,7 @@ const isValuableRaidAlternative = (mon, raidScore) => {
   }
 
   // Top type rankings - being #1-3 in a type with good performance - TIGHTENED
-  const hasTopTypeRanking = (mon.bestTypes || []).some((t) => parseInt(t.rank) <= 3 && parseFloat(t.score) >= 14);
+  const hasTopTypeRanking = hasTypeRanking(mon, 3, 14);
   if (hasTopTypeRanking && tierScore >= 10) {
     return true; // Top type specialists (raised rank requirement from 5 to 3, score from 12 to 14)
   }
@@ -1008,6 +1013,20 @@ const isValuableRaidAlternative = (mon, raidScore) => {
   return false; // Not worthy of Valuable tier for raids
 };
 
+// Best gym defenders - excellent defensive typing + bulk
+const EXCELLENT_DEFENSIVE_TYPES = compileTypings([
+  ["Steel", "Fairy"], // Excellent defensive combination
+  ["Steel", "Psychic"], // Great defensive typing
+  ["Dragon", "Steel"], // Powerful defensive combo
+  ["Fairy", "Flying"], // Good defensive typing
+]);
+
+// Best gym attackers - powerful offensive typing - TIGHTENED
+const EXCELLENT_OFFENSIVE_TYPES = compileTypings([
+  ["Dragon"], // Neutral damage, high stats
+  ["Steel"], // Great offensive typing
+]);
+
 /**
  * BEST GYM SPECIALIST DETECTION
  *
@@ -1015,27 +1034,13 @@ const isValuableRaidAlternative = (mon, raidScore) => {
  * Only the clear best gym attackers/defenders qualify
  */
 const isBestGymSpecialist = (mon, maxCoreScore) => {
-  // Best gym defenders - excellent defensive typing + bulk
-  const excellentDefensiveTypes = [
-    ["Steel", "Fairy"], // Excellent defensive combination
-    ["Steel", "Psychic"], // Great defensive typing
-    ["Dragon", "Steel"], // Powerful defensive combo
-    ["Fairy", "Flying"], // Good defensive typing
-  ];
-
-  const hasExcellentDefensiveTyping = excellentDefensiveTypes.some((types) => types.every((type) => mon.types?.includes(type)));
+  const hasExcellentDefensiveTyping = matchesTyping(EXCELLENT_DEFENSIVE_TYPES, mon.types);
 
   if (hasExcellentDefensiveTyping && maxCoreScore >= 80) {
     return true; // Best gym defenders (raised from 70)
   }
 
-  // Best gym attackers - powerful offensive typing - TIGHTENED
-  const excellentOffensiveTypes = [
-    ["Dragon"], // Neutral damage, high stats
-    ["Steel"], // Great offensive typing
-  ];
-
-  const hasExcellentOffensiveTyping = excellentOffensiveTypes.some((types) => types.every((type) => mon.types?.includes(type)));
+  const hasExcellentOffensiveTyping = matchesTyping(EXCELLENT_OFFENSIVE_TYPES, mon.types);
 
   // Must have decent performance to be considered - TIGHTENED
   if (hasExcellentOffensiveTyping && maxCoreScore >= 75) {
@@ -1051,10 +1056,8 @@ const isBestGymSpecialist = (mon, maxCoreScore) => {
  * Determines if a Pokemon is worthy of Reliable tier for PvP
  * Focus: Good but replaceable Pokemon with clear utility
  */
-const isReliableAlternative = (mon, pvpScore, leagues) => {
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreScores = coreLeagues.map((league) => leagues[league]?.score || 0);
-  const maxCoreScore = Math.max(...coreScores);
+const isReliableAlternative = (mon, pvpScore, leagueSummary) => {
+  const { coreScores, maxCoreScore, maxLimitedScore } = leagueSummary;
 
   // Decent core league performance (82-86.9) - PATTERN ANALYSIS TIGHTENED
   if (maxCoreScore >= 82 && maxCoreScore < 87 && pvpScore >= 16) {
@@ -1067,10 +1070,6 @@ const isReliableAlternative = (mon, pvpScore, leagues) => {
   }
 
   // Limited league specialists with strong core backup - PATTERN ANALYSIS TIGHTENED
-  const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
-  const maxLimitedScore = Math.max(...limitedScores);
-
   if (maxLimitedScore >= 92 && maxCoreScore >= 75 && pvpScore >= 16) {
     return true; // Limited league specialists need stronger backup (raised pvpScore from 14)
   }
@@ -1102,7 +1101,7 @@ const isReliableRaidAlternative = (mon, raidScore) => {
   // This removes 62 Pokemon that were over-inflating Reliable tier
 
   // Strong type rankings only - PATTERN ANALYSIS TIGHTENED
-  const hasStrongTypeRanking = (mon.bestTypes || []).some((t) => parseInt(t.rank) <= 10 && parseFloat(t.score) >= 14);
+  const hasStrongTypeRanking = hasTypeRanking(mon, 10, 14);
   if (hasStrongTypeRanking && tierScore >= 10) {
     return true; // Strong type specialists with A tier minimum (raised requirements)
   }
@@ -1110,27 +1109,43 @@ const isReliableRaidAlternative = (mon, raidScore) => {
   return false; // Not worthy of Reliable tier for raids
 };
 
+// Starter Pokemon are generally accessible
+const STARTER_NAMES = ["Venusaur", "Charizard", "Blastoise", "Meganium", "Typhlosion", "Feraligatr"];
+
+// Common Pokemon that are easy to obtain
+const COMMON_TYPES = new Set(["Normal", "Bug", "Flying"]);
+
 /**
  * BUDGET ALTERNATIVE DETECTION
  *
  * Determines if a Pokemon is a budget-friendly alternative
  */
 const isBudgetAlternative = (mon) => {
-  // Starter Pokemon are generally accessible
-  const starterNames = ["Venusaur", "Charizard", "Blastoise", "Meganium", "Typhlosion", "Feraligatr"];
-  if (starterNames.some((name) => mon.name.includes(name))) {
+  if (STARTER_NAMES.some((name) => mon.name.includes(name))) {
     return true;
   }
 
-  // Common Pokemon that are easy to obtain
-  const commonTypes = ["Normal", "Bug", "Flying"];
-  if (mon.types?.some((type) => commonTypes.includes(type))) {
+  if (mon.types?.some((type) => COMMON_TYPES.has(type))) {
     return true;
   }
 
   return false;
 };
 
+// Rare and valuable typing combinations
+const RARE_TYPINGS = compileTypings([
+  ["Steel", "Fairy"], // Excellent defensive combination
+  ["Steel", "Psychic"], // Great defensive typing
+  ["Dragon", "Steel"], // Powerful defensive combo
+  ["Ghost", "Steel"], // Unique defensive typing
+  ["Fire", "Steel"], // Rare offensive/defensive mix
+  ["Water", "Steel"], // Uncommon defensive typing
+  ["Electric", "Steel"], // Rare combination
+  ["Rock", "Fairy"], // Very rare combination (Carbink)
+  ["Bug", "Steel"], // Uncommon but potentially useful
+  ["Ice", "Steel"], // Rare defensive combination
+]);
+
 /**
  * RARE TYPING COMBINATION DETECTION
  *
@@ -1139,22 +1154,8 @@ const isBudgetAlternative = (mon) => {
 const hasRareTypingCombination = (mon) => {
   if (!mon.types || mon.types.length === 0) return false;
 
-  // Define rare and valuable typing combinations
-  const rareTypings = [
-    ["Steel", "Fairy"], // Excellent defensive combination
-    ["Steel", "Psychic"], // Great defensive typing
-    ["Dragon", "Steel"], // Powerful defensive combo
-    ["Ghost", "Steel"], // Unique defensive typing
-    ["Fire", "Steel"], // Rare offensive/defensive mix
-    ["Water", "Steel"], // Uncommon defensive typing
-    ["Electric", "Steel"], // Rare combination
-    ["Rock", "Fairy"], // Very rare combination (Carbink)
-    ["Bug", "Steel"], // Uncommon but potentially useful
-    ["Ice", "Steel"], // Rare defensive combination
-  ];
-
   // Check if Pokemon has any of these rare combinations
-  return rareTypings.some((rareTypes) => rareTypes.every((type) => mon.types.includes(type)));
+  return matchesTyping(RARE_TYPINGS, mon.types);
 };
 
 /**
@@ -1163,10 +1164,8 @@ const hasRareTypingCombination = (mon) => {
  * Determines if a Pokemon is worthy of Useful tier for PvP
  * Focus: Situational spice, one-cup wonders, limited role Pokemon
  */
-const isUsefulAlternative = (mon, pvpScore, leagues) => {
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreScores = coreLeagues.map((league) => leagues[league]?.score || 0);
-  const maxCoreScore = Math.max(...coreScores);
+const isUsefulAlternative = (mon, pvpScore, leagueSummary) => {
+  const { coreScores, maxCoreScore, maxLimitedScore } = leagueSummary;
 
   // Good PvP performance (75-79.9) - FINAL ADJUSTMENT TIGHTENED
   if (maxCoreScore >= 75 && maxCoreScore < 80 && pvpScore >= 14) {
@@ -1174,10 +1173,6 @@ const isUsefulAlternative = (mon, pvpScore, leagues) => {
   }
 
   // Cup specialists with decent performance - PATTERN ANALYSIS TIGHTENED
-  const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
-  const maxLimitedScore = Math.max(...limitedScores);
-
   if (maxLimitedScore >= 87 && maxCoreScore >= 65 && pvpScore >= 12) {
     return true; // One-cup wonders need stronger performance (raised from 85/60)
   }
@@ -1216,7 +1211,7 @@ const isUsefulRaidAlternative = (mon, raidScore) => {
   }
 
   // Good type rankings with decent requirements - PATTERN ANALYSIS TIGHTENED
-  const hasGoodTypeRanking = (mon.bestTypes || []).some((t) => parseInt(t.rank) <= 15 && parseFloat(t.score) >= 12);
+  const hasGoodTypeRanking = hasTypeRanking(mon, 15, 12);
   if (hasGoodTypeRanking && tierScore >= 6) {
     return true; // Good type specialists (raised from rank 20/score 10)
   }
@@ -1230,10 +1225,8 @@ const isUsefulRaidAlternative = (mon, raidScore) => {
  * Determines if a Pokemon is worthy of Niche tier for PvP
  * Focus: Rarely useful, but might shine in fringe formats
  */
-const isNicheAlternative = (mon, pvpScore, leagues) => {
-  const coreLeagues = ["great", "ultra", "master"];
-  const coreScores = coreLeagues.map((league) => leagues[league]?.score || 0);
-  const maxCoreScore = Math.max(...coreScores);
+const isNicheAlternative = (mon, pvpScore, leagueSummary) => {
+  const { coreScores, maxCoreScore, maxLimitedScore } = leagueSummary;
 
   // Moderate PvP performance (72-74.9) - FINAL ADJUSTMENT TIGHTENED
   if (maxCoreScore >= 72 && maxCoreScore < 75 && pvpScore >= 10) {
@@ -1246,10 +1239,6 @@ const isNicheAlternative = (mon, pvpScore, leagues) => {
   }
 
   // Limited league specialists with minimal backup
-  const limitedLeagues = ["hisui", "battlefrontiermaster", "battlefrontierultra", "sunshine"];
-  const limitedScores = limitedLeagues.map((league) => leagues[league]?.score || 0);
-  const maxLimitedScore = Math.max(...limitedScores);
-
   if (maxLimitedScore >= 80 && maxCoreScore >= 50 && pvpScore >= 6) {
     return true; // Fringe format specialists
   }
@@ -1277,7 +1266,7 @@ const isNicheRaidAlternative = (mon, raidScore) => {
   }
 
   // Poor type rankings with minimal requirements
-  const hasPoorTypeRanking = (mon.bestTypes || []).some((t) => parseInt(t.rank) <= 30 && parseFloat(t.score) >= 8);
+  const hasPoorTypeRanking = hasTypeRanking(mon, 30, 8);
   if (hasPoorTypeRanking && tierScore >= 3) {
     return true; // Poor type specialists
   }
@@ -1307,6 +1296,9 @@ const isNicheRaidAlternative = (mon, raidScore) => {
  * - trashability: Tier name (Essential, Valuable, etc.)
  */
 const calculateTrashability = (mon) => {
+  const leagues = mon.leagues || {};
+  const leagueSummary = summarizeLeagues(leagues);
+
   // Use the enhanced PvP score that includes all our new logic
   const pvp = pvpScore(mon); // This includes weakness analysis, move penalties, etc.
   const raidTier = raidTierScore(mon.raidTier);
@@ -1319,19 +1311,19 @@ const calculateTrashability = (mon) => {
   }
   const totalRaid = raidTier + raidType + raidMoves;
   const defense = defenseScore(mon.defenderTier);
-  const legacy = legacyScore(mon);
-  const unique = uniquenessScore(mon);
+  const legacy = legacyScore(mon, pvp, raidTier);
+  const unique = uniquenessScore(pvp, raidTier);
 
   let anchors = [];
 
   // TIGHTENED PvP thresholds for better balance
-  if (isValuablePvPAlternative(mon, pvp, mon.leagues || {})) {
+  if (isValuablePvPAlternative(mon, pvp, leagueSummary)) {
     anchors.push(tierRank.Valuable); // TIGHTENED: Requires worthiness check
-  } else if (isReliableAlternative(mon, pvp, mon.leagues || {})) {
+  } else if (isReliableAlternative(mon, pvp, leagueSummary)) {
     anchors.push(tierRank.Reliable); // TIGHTENED: Requires worthiness check
-  } else if (isUsefulAlternative(mon, pvp, mon.leagues || {})) {
+  } else if (isUsefulAlternative(mon, pvp, leagueSummary)) {
     anchors.push(tierRank.Useful); // PATTERN ANALYSIS: Demoted from Reliable
-  } else if (isNicheAlternative(mon, pvp, mon.leagues || {})) {
+  } else if (isNicheAlternative(mon, pvp, leagueSummary)) {
     anchors.push(tierRank.Niche); // PATTERN ANALYSIS: Demoted from Useful
   } else if (pvp >= 12) anchors.push(tierRank.Reliable); // Decent PvP performance
   else if (pvp >= 8) anchors.push(tierRank.Useful); // Situational PvP utility
@@ -1339,7 +1331,7 @@ const calculateTrashability = (mon) => {
 
   // Smart raid criteria - require both performance and meta relevance
   const hasEliteRaidTier = raidTier >= 15; // A+ or S tier
-  const hasTopTypeRanking = (mon.bestTypes || []).some((t) => parseInt(t.rank) <= 15 && parseFloat(t.score) >= 13);
+  const hasTopTypeRanking = hasTypeRanking(mon, 15, 13);
   const hasRaidMetaTyping = hasMetaRelevantTyping(mon); // Use same typing logic
 
   // More inclusive for A+ tier specialists even with awkward typing
@@ -1347,7 +1339,7 @@ const calculateTrashability = (mon) => {
   const isRaidElite = (totalRaid >= 25 && (hasEliteRaidTier || hasTopTypeRanking) && hasRaidMetaTyping) || isTopTierSpecialist;
 
   // Apply smart overfitting detection to raid logic as well
-  const hasLegitimateUsage = hasActualCompetitiveUsage(mon, mon.leagues || {});
+  const hasLegitimateUsage = hasActualCompetitiveUsage(mon, leagues, leagueSummary);
 
   if (isRaidElite && hasLegitimateUsage) {
     anchors.push(tierRank.Essential); // Requires performance + meta-relevant typing + legitimate usage
@@ -1374,7 +1366,7 @@ const calculateTrashability = (mon) => {
   }
 
   // Role dominance can override base calculations
-  const overrideTier = roleDominanceTier(mon);
+  const overrideTier = roleDominanceTier(mon, leagues, leagueSummary, pvp, raidTier);
   if (overrideTier && overrideTier > baseRank) baseRank = overrideTier;
 
   // Essential tier requires actual usage data
@@ -1431,14 +1423,11 @@ const updated = data.map((mon) => {
     console.log(`DEBUG: ${current} →`, rating);
   }
 
-  // Return Pokemon with updated trashability data (preserve recommendedCount)
-  return {
-    ...mon,
-    trashabilityScore: rating.trashabilityScore,
-    trashability: rating.trashability,
-    // Preserve recommendedCount from input data (calculated by updateRecommendedCount.js)
-    recommendedCount: mon.recommendedCount,
-  };
+  // Update trashability data in place; recommendedCount from the input data
+  // (calculated by updateRecommendedCount.js) is left untouched
+  mon.trashabilityScore = rating.trashabilityScore;
+  mon.trashability = rating.trashability;
+  return mon;
 });
 
 // Save updated data to output file